@@ -1,5 +1,14 @@
 # -*- coding: utf-8 -*-
 import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:   # 沒裝 numba 也能照常使用純 Python / NumPy 版本
+    njit = None
+
+# numpy 2.0 把 trapz 改名為 trapezoid
+_np_trapezoid = getattr(np, "trapezoid", None) or np.trapz
 
 # -------------------------
 # 數值積分：梯形法
@@ -8,6 +17,8 @@ def integrate_trapezoid(f, a, b, n=4000):
     """
     近似積分 ∫_a^b f(t) dt (梯形法)
     n: 分割數，越大越準 (但太大會慢)
+    f 若支援 ndarray（如 np.sin/np.exp 組合）就整條一次算完；
+    只吃純量的 f 則退回逐點累加
     """
     if a == b:
         return 0.0
@@ -15,35 +26,176 @@ def integrate_trapezoid(f, a, b, n=4000):
         return -integrate_trapezoid(f, b, a, n)
 
     h = (b - a) / n
-    s = 0.5 * (f(a) + f(b))
-    for i in range(1, n):
-        s += f(a + i * h)
-    return s * h
+    xs = np.linspace(a, b, n + 1)
+    try:
+        fx = f(xs)
+        if np.isscalar(fx):
+            raise TypeError("f is not vectorized")
+    except (TypeError, ValueError):
+        # f 不能向量化就退回逐點評估：math.sin 遇到 ndarray 丟
+        # TypeError，帶 if 分支的 f 則丟 ValueError（陣列真值不明確）；
+        # 用 math.fsum（補償求和）避免累加 O(n) 的捨入誤差，
+        # 同樣精度下 n 可以取得更小
+        s = 0.5 * (f(a) + f(b)) + math.fsum(f(a + i * h) for i in range(1, n))
+        return s * h
+    # 梯形公式交給 numpy 的 C 實作一次算完
+    return float(_np_trapezoid(fx, dx=h))
+
+# -------------------------
+# 數值積分：梯形法（Numba JIT 版）
+# -------------------------
+# f 沒辦法向量化時的另一條路：把整個迴圈編譯成機器碼。
+# 傳進來的 f_jit 也要是 @njit 過的函數（見下面的 f1_njit / f2_njit）。
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def integrate_trapezoid_njit(f_jit, a, b, n=4000):
+        if a == b:
+            return 0.0
+        sign = 1.0
+        if b < a:
+            a, b = b, a
+            sign = -1.0
+        h = (b - a) / n
+        s = 0.5 * (f_jit(a) + f_jit(b))
+        for i in range(1, n):
+            s += f_jit(a + i * h)
+        return sign * s * h
+
+    @njit(cache=True)
+    def f1_njit(t):
+        return math.sin(t) + t * t
+
+    @njit(cache=True)
+    def f2_njit(t):
+        return math.exp(-t * t)
+
+# -------------------------
+# 數值積分：自適應 Simpson
+# -------------------------
+def adaptive_simpson(f, a, b, eps=1e-10, max_depth=60):
+    """
+    自適應 Simpson 法：每段用二次多項式擬合，
+    |S_left + S_right - S_whole| > 15*eps 才繼續細分，
+    平滑區域不會浪費取樣，收斂是 O(h^4)（梯形法只有 O(h^2)）。
+    用明確的 stack 而不是遞迴，避免 Python 遞迴深度限制；
+    端點與中點的函數值都往下傳，不重複評估 f。
+    """
+    if a == b:
+        return 0.0
+    if b < a:
+        return -adaptive_simpson(f, b, a, eps, max_depth)
+
+    def simpson(fa, fm, fb, width):
+        return width / 6.0 * (fa + 4.0 * fm + fb)
+
+    m = 0.5 * (a + b)
+    fa, fm, fb = f(a), f(m), f(b)
+    total = 0.0
+    # stack 項目：(a, m, b, fa, fm, fb, 該段的 Simpson 值, 容許誤差, 深度)
+    stack = [(a, m, b, fa, fm, fb, simpson(fa, fm, fb, b - a), eps, 0)]
+    while stack:
+        a0, m0, b0, fa0, fm0, fb0, whole, eps0, depth = stack.pop()
+        lm = 0.5 * (a0 + m0)
+        rm = 0.5 * (m0 + b0)
+        flm = f(lm)
+        frm = f(rm)
+        left = simpson(fa0, flm, fm0, m0 - a0)
+        right = simpson(fm0, frm, fb0, b0 - m0)
+        diff = left + right - whole
+        if abs(diff) <= 15.0 * eps0 or depth >= max_depth:
+            total += left + right + diff / 15.0  # Richardson 校正
+        else:
+            half_eps = 0.5 * eps0
+            stack.append((a0, lm, m0, fa0, flm, fm0, left, half_eps, depth + 1))
+            stack.append((m0, rm, b0, fm0, frm, fb0, right, half_eps, depth + 1))
+    return total
 
 # -------------------------
 # F(x) = ∫_0^x f(t) dt
 # -------------------------
-def F_of_x(f, x, n=4000):
-    return integrate_trapezoid(f, 0.0, x, n)
+def F_of_x(f, x, eps=1e-10):
+    return adaptive_simpson(f, 0.0, x, eps)
 
 # -------------------------
 # 數值微分：中心差分
 # -------------------------
 def derivative_center(g, x, h=1e-4):
-    return (g(x + h) - g(x - h)) / (2.0 * h)
+    """
+    中心差分；x 可以是純量或整個陣列（g 需支援 broadcast），
+    一次就把所有點的導數算完
+    """
+    x = np.asarray(x, dtype=np.float64)
+    d = (g(x + h) - g(x - h)) / (2.0 * h)
+    return float(d) if np.ndim(d) == 0 else d
 
 # -------------------------
 # 驗證：比較 d/dx ∫_0^x f(t)dt 與 f(x)
 # -------------------------
+def _eval_grid(f, xs):
+    # f 支援 ndarray 就整條一次算；純量版 f 退回逐點評估
+    # （與 integrate_trapezoid 的 fallback 同一套判斷）
+    try:
+        fx = np.asarray(f(xs), dtype=np.float64)
+        if fx.shape != xs.shape:
+            raise TypeError("f is not vectorized")
+        return fx
+    except (TypeError, ValueError):
+        return np.array([f(x) for x in xs], dtype=np.float64)
+
 def verify_ftc(f, xs, n_int=4000, h=1e-4):
-    # 把 F 固定成一個函數（內部用數值積分）
+    # 所有 x 共用同一條密網格：f 只算 n_int 次，
+    # 累積積分用一次 np.cumsum 算完，之後查 F(x) 只是內插
+    xs = np.asarray(xs, dtype=np.float64)
+    lo = min(float(xs.min()), 0.0)
+    hi = max(float(xs.max()), 0.0)
+    # 網格兩端多留一點，差分時 x±h 才不會踩出網格外
+    pad = max(2 * h, 8 * (hi - lo) / n_int)
+    grid = np.linspace(lo - pad, hi + pad, n_int)
+    dx = grid[1] - grid[0]
+    fvals = _eval_grid(f, grid)
+    F = np.concatenate(([0.0], np.cumsum(0.5 * (fvals[:-1] + fvals[1:])) * dx))
+    # F 是從 x_min 起算的累積積分，平移使 F(0)=0 才是 ∫_0^x
+    F0 = np.interp(0.0, grid, F)
+
     def G(x):
-        return F_of_x(f, x, n=n_int)
+        return np.interp(x, grid, F) - F0
+
+    # F 是折線，差分步長比網格還細只會量到單一線段的斜率，
+    # 所以 h 至少取兩格寬
+    h = max(h, 2.0 * float(dx))
+
+    # 差分、f(x)、誤差全部一次算完，迴圈只負責列印
+    fp = derivative_center(G, xs, h=h)
+    fx = _eval_grid(f, xs)
+    err = np.abs(fp - fx)
+
+    print("x\t\tF'(x)≈d/dx∫_0^x f(t)dt\tf(x)\t\tabs error")
+    print("-" * 80)
+    for x, fpi, fxi, erri in zip(xs, fp, fx, err):
+        print(f"{x: .5f}\t{fpi: .10f}\t\t\t{fxi: .10f}\t{erri: .3e}")
+
+# -------------------------
+# 驗證（多行程版）：f 無法向量化時，各個 x 彼此獨立，
+# 用 ProcessPoolExecutor 把逐點積分攤到多顆核心
+# -------------------------
+def _ftc_slope_at(args):
+    # 必須是模組頂層函數才能 pickle 給子行程
+    f, x, n_int, h = args
+
+    def G(t):
+        return integrate_trapezoid(f, 0.0, float(t), n_int)
+
+    return derivative_center(G, x, h=h)
+
+def verify_ftc_parallel(f, xs, n_int=4000, h=1e-4, max_workers=None):
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        fps = list(ex.map(_ftc_slope_at, [(f, x, n_int, h) for x in xs]))
 
     print("x\t\tF'(x)≈d/dx∫_0^x f(t)dt\tf(x)\t\tabs error")
     print("-" * 80)
-    for x in xs:
-        fp = derivative_center(G, x, h=h)
+    for x, fp in zip(xs, fps):
         fx = f(x)
         err = abs(fp - fx)
         print(f"{x: .5f}\t{fp: .10f}\t\t\t{fx: .10f}\t{err: .3e}")
@@ -52,10 +204,11 @@ def verify_ftc(f, xs, n_int=4000, h=1e-4):
 # 測試函數（你也可以自己換）
 # -------------------------
 def f1(t):
-    return math.sin(t) + t*t
+    # np.sin 對純量/陣列都適用
+    return np.sin(t) + t*t
 
 def f2(t):
-    return math.exp(-t*t)
+    return np.exp(-t*t)
 
 if __name__ == "__main__":
     xs = [-1.5, -1.0, -0.3, 0.0, 0.2, 0.7, 1.3, 2.0]
@@ -1,5 +1,5 @@
-import cmath
 import math
+import numpy as np
 
 # =========================
 # 參數設定
@@ -18,24 +18,45 @@ dw = 2 * W / M
 # =========================
 
 def f(x):
-    # 高斯函數（Fourier 轉換性質很好）
-    return math.exp(-x * x)
+    # 高斯函數（Fourier 轉換性質很好），對 ndarray 也可直接運算
+    return np.exp(-x * x)
 
 # =========================
 # 正傅立葉轉換（數值積分）
 # F(ω) = ∫ f(x) e^{-i ω x} dx
 # =========================
 
+# dft 與 idft 的相位矩陣只差一個共軛，建一次就夠；
+# 以 (L, W, N, M) 為 key 快取，參數沒變就直接重用
+_kernel_cache = {}
+
+def build_kernel(xs, omegas):
+    key = (L, W, N, M)
+    K = _kernel_cache.get(key)
+    if K is None:
+        K = np.exp(-1j * omegas[:, None] * xs[None, :])
+        _kernel_cache[key] = K
+    return K
+
+def _fft_grid_ok():
+    # 兩個等距網格若滿足 dx*dw = 2π/N（且 N=M），
+    # 連續 Fourier 積分就剛好是一個帶線性相位修正的離散 FFT
+    return N == M and abs(dx * dw * N - 2 * math.pi) < 1e-9
+
 def dft(f):
-    omegas = [(-W + j * dw) for j in range(M)]
-    F = []
+    xs = -L + np.arange(N) * dx
+    omegas = -W + np.arange(M) * dw
+
+    if _fft_grid_ok():
+        # 展開 ω_j x_k 後，非 2πjk/N 的部分都是可以提出的線性相位：
+        # F_j = dx · e^{iL(ω_j+W)} · FFT( f(x)·e^{iWx} )_j
+        pre = f(xs) * np.exp(1j * W * xs)
+        F = dx * np.exp(1j * L * (omegas + W)) * np.fft.fft(pre)
+        return omegas, F
 
-    for w in omegas:
-        s = 0j
-        for i in range(N):
-            x = -L + i * dx
-            s += f(x) * cmath.exp(-1j * w * x) * dx
-        F.append(s)
+    # 網格不相容時退回 O(N·M) 相位矩陣：K[j, i] = e^{-i ω_j x_i}
+    K = build_kernel(xs, omegas)
+    F = K @ f(xs) * dx
 
     return omegas, F
 
@@ -45,14 +66,18 @@ def dft(f):
 # =========================
 
 def idft(omegas, F):
-    xs = [(-L + i * dx) for i in range(N)]
-    f_rec = []
-
-    for x in xs:
-        s = 0j
-        for w, Fw in zip(omegas, F):
-            s += Fw * cmath.exp(1j * w * x) * dw
-        f_rec.append((1 / (2 * math.pi)) * s)
+    xs = -L + np.arange(N) * dx
+
+    if _fft_grid_ok():
+        # 同樣的推導取 e^{+i} 核：
+        # f_k = (dw·N/2π) · e^{-iWx_k} · IFFT( F·e^{-iL(ω+W)} )_k
+        pre = F * np.exp(-1j * L * (omegas + W))
+        f_rec = (dw * N / (2 * math.pi)) * np.exp(-1j * W * xs) * np.fft.ifft(pre)
+        return xs, f_rec
+
+    # 逆轉換的核是正轉換的共軛轉置，重用同一份 K
+    K = build_kernel(xs, omegas)
+    f_rec = (K.conj().T @ F) * dw / (2 * math.pi)
 
     return xs, f_rec
 
@@ -1,40 +1,39 @@
-import cmath
+import numpy as np
 
 def root3(a, b, c, d):
     if a == 0:
         raise ValueError("a 不能為 0，否則不是三次多項式")
 
-    # 1. 正規化
-    A = b / a
-    B = c / a
-    C = d / a
-
-    # 2. 降階 x = y - A/3
-    p = B - A**2 / 3
-    q = 2*A**3 / 27 - A*B / 3 + C
-
-    # 3. 判別式
-    Δ = (q/2)**2 + (p/3)**3
-
-    # 4. Cardano
-    sqrtΔ = cmath.sqrt(Δ)
-    u = (-q/2 + sqrtΔ) ** (1/3)
-    v = (-q/2 - sqrtΔ) ** (1/3)
-
-    # 複數立方根的單位根
-    omega = complex(-0.5, cmath.sqrt(3)/2)
+    # np.roots 會建 companion matrix 交給 LAPACK 求特徵值，
+    # 比手寫 Cardano 數值穩定（複數 **(1/3) 只挑一個分支，容易出錯）
+    x1, x2, x3 = np.roots([a, b, c, d])
+    return x1, x2, x3
 
-    y1 = u + v
-    y2 = omega*u + omega**2*v
-    y3 = omega**2*u + omega*v
+def root3_batch(coeffs):
+    """
+    一次解很多條三次式：coeffs 為 (k, 4) 的 [a, b, c, d] 陣列。
+    堆一疊 (k, 3, 3) companion matrix，一次 eigvals 呼叫解完。
+    回傳 (k, 3) 的根。
+    """
+    coeffs = np.asarray(coeffs, dtype=complex)
+    if coeffs.ndim != 2 or coeffs.shape[1] != 4:
+        raise ValueError("coeffs 需為 (k, 4) 陣列")
+    if np.any(coeffs[:, 0] == 0):
+        raise ValueError("a 不能為 0，否則不是三次多項式")
 
-    # 5. 轉回 x
-    shift = A / 3
-    x1 = y1 - shift
-    x2 = y2 - shift
-    x3 = y3 - shift
+    # 正規化成 x^3 + B x^2 + C x + D
+    k = coeffs.shape[0]
+    B = coeffs[:, 1] / coeffs[:, 0]
+    C = coeffs[:, 2] / coeffs[:, 0]
+    D = coeffs[:, 3] / coeffs[:, 0]
 
-    return x1, x2, x3
+    comp = np.zeros((k, 3, 3), dtype=complex)
+    comp[:, 1, 0] = 1.0
+    comp[:, 2, 1] = 1.0
+    comp[:, 0, 2] = -D
+    comp[:, 1, 2] = -C
+    comp[:, 2, 2] = -B
+    return np.linalg.eigvals(comp)
 
 def f(x, a, b, c, d):
     return a*x**3 + b*x**2 + c*x + d
@@ -42,4 +41,4 @@ def f(x, a, b, c, d):
 roots = root3(1, 0, 0, 1)  # x^3 + 1 = 0
 
 for r in roots:
-    print(r, "->", f(r, 1, 0, 0, 1))
\ No newline at end of file
+    print(r, "->", f(r, 1, 0, 0, 1))
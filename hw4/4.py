@@ -1,3 +1,5 @@
+import numpy as np
+
 def find_one_root_hill(c, tol=1e-10, max_iter=200000, restarts=60):
     R = cauchy_bound(c)
 
@@ -22,16 +24,15 @@ def find_one_root_hill(c, tol=1e-10, max_iter=200000, restarts=60):
                 best_val = val
                 best_z = z
 
-            # try a few random neighbors, accept if improved
-            improved = False
-            for _ in range(20):
-                dz = step * (random.random() - 0.5 + 1j * (random.random() - 0.5))
-                z2 = z + dz
-                p2, _ = poly_and_derivative(c, z2)
-                if abs(p2) < val:
-                    z = z2
-                    improved = True
-                    break
+            # try a batch of random neighbors at once, accept the best if improved
+            # (20 probes = two numpy vector ops instead of 20 Python iterations)
+            dz = step * (np.random.rand(20) - 0.5 + 1j * (np.random.rand(20) - 0.5))
+            z2 = z + dz
+            p2 = np.polyval(c[::-1], z2)  # c 是低次在前，polyval 要高次在前
+            i = int(np.argmin(np.abs(p2)))
+            improved = abs(p2[i]) < val
+            if improved:
+                z = complex(z2[i])
 
             # if stuck, shrink step; if too small, restart
             if not improved:
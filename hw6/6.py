@@ -3,11 +3,90 @@ import math
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:   # numba 未安裝時退回純 Python kernel
+    njit = None
+
+def _maybe_njit(fn):
+    return njit(cache=True)(fn) if njit is not None else fn
+
 EPS = 1e-9
 
 def is_close(a: float, b: float, eps: float = EPS) -> bool:
     return abs(a - b) <= eps
 
+# =========================
+# JIT kernels：幾何熱路徑的純 float 計算
+# （dataclass 只做拆裝，數學都在這裡，讓 numba 編成機器碼）
+# =========================
+@_maybe_njit
+def _rotate_kernel(x, y, cx, cy, c, s):
+    vx = x - cx
+    vy = y - cy
+    return c * vx - s * vy + cx, s * vx + c * vy + cy
+
+@_maybe_njit
+def _project_kernel(a, b, c, px, py, inv_n2):
+    # inv_n2 = 1/(a*a + b*b) 由呼叫端傳入（Line 會把它快取起來），
+    # 乘倒數取代除法
+    t = (a * px + b * py + c) * inv_n2
+    return px - a * t, py - b * t
+
+@_maybe_njit
+def _intersect_lc_kernel(a, b, c, h, k, r, inv):
+    # 回傳 (交點數, x1, y1, x2, y2)；交點數 -1 代表線無效
+    # inv = 1/sqrt(a*a + b*b) 由呼叫端傳入（Line 會把它快取起來，
+    # 退化線為 0.0）；整個 kernel 只乘倒數，完全沒有除法
+    if inv <= 0.0:
+        return -1, 0.0, 0.0, 0.0, 0.0
+    nd = (a * h + b * k + c) * inv  # 帶號距離
+    # 先用平方式判斷不相交（最常見情況）：兩個乘法就能早退，不用 sqrt
+    rr = r + 1e-9
+    if nd * nd > rr * rr:
+        return 0, 0.0, 0.0, 0.0, 0.0
+    d = abs(nd)
+    t = nd * inv
+    fx = h - a * t
+    fy = k - b * t
+    if abs(d - r) <= 1e-7:
+        return 1, fx, fy, 0.0, 0.0
+    ux = b * inv
+    uy = -a * inv
+    step = math.sqrt(max(0.0, r * r - d * d))
+    return 2, fx + ux * step, fy + uy * step, fx - ux * step, fy - uy * step
+
+@_maybe_njit
+def _intersect_cc_kernel(x0, y0, r0, x1, y1, r1):
+    dx = x1 - x0
+    dy = y1 - y0
+    d2 = dx * dx + dy * dy
+    # 相離（最常見）用平方比較早退，sqrt 留給確定有交點的路徑
+    rsum = r0 + r1 + 1e-9
+    if d2 > rsum * rsum:
+        return 0, 0.0, 0.0, 0.0, 0.0
+    d = math.sqrt(d2)
+    if d < abs(r0 - r1) - 1e-9:
+        return 0, 0.0, 0.0, 0.0, 0.0
+    if d <= 1e-9 and abs(r0 - r1) <= 1e-9:
+        return 0, 0.0, 0.0, 0.0, 0.0
+    a = (r0 * r0 - r1 * r1 + d * d) / (2 * d)
+    h2 = r0 * r0 - a * a
+    if h2 < 0 and h2 > -1e-8:
+        h2 = 0.0
+    if h2 < 0:
+        return 0, 0.0, 0.0, 0.0, 0.0
+    vx = dx / d
+    vy = dy / d
+    p2x = x0 + vx * a
+    p2y = y0 + vy * a
+    if abs(h2) <= 1e-7:
+        return 1, p2x, p2y, 0.0, 0.0
+    hh = math.sqrt(h2)
+    return 2, p2x - vy * hh, p2y + vx * hh, p2x + vy * hh, p2y - vx * hh
+
 # =========================
 # Point
 # =========================
@@ -61,16 +140,146 @@ class Point:
         # p' = c + R(theta)*(p-c)
         if center is None:
             center = Point(0.0, 0.0)
-        v = self - center
         c = math.cos(theta_rad)
         s = math.sin(theta_rad)
-        v2 = Point(c * v.x - s * v.y, s * v.x + c * v.y)
-        return center + v2
+        x2, y2 = _rotate_kernel(self.x, self.y, center.x, center.y, c, s)
+        return Point(x2, y2)
 
     def __repr__(self) -> str:
         return f"Point({self.x:.6f}, {self.y:.6f})"
 
 
+# =========================
+# Rotation：預先算好 (cos, sin) 的旋轉
+# 同一角度要套在很多點 / 圖形上時，sincos 只付一次
+# =========================
+class Rotation:
+    __slots__ = ("c", "s", "cx", "cy")
+
+    def __init__(self, theta_rad: float, center: Point = None):
+        self.c = math.cos(theta_rad)
+        self.s = math.sin(theta_rad)
+        self.cx = 0.0 if center is None else center.x
+        self.cy = 0.0 if center is None else center.y
+
+    def apply(self, p: Point) -> Point:
+        x2, y2 = _rotate_kernel(p.x, p.y, self.cx, self.cy, self.c, self.s)
+        return Point(x2, y2)
+
+    def apply_array(self, pts: "PointArray") -> "PointArray":
+        vx = pts.xs - self.cx
+        vy = pts.ys - self.cy
+        return PointArray(self.c * vx - self.s * vy + self.cx,
+                          self.s * vx + self.c * vy + self.cy)
+
+    def __repr__(self) -> str:
+        return (f"Rotation(cos={self.c:.6f}, sin={self.s:.6f}, "
+                f"center=({self.cx:.6f}, {self.cy:.6f}))")
+
+
+# =========================
+# PointArray / TriangleArray：SoA 批次版本
+# 一次變換 N 個點只要幾個向量運算，不用配置 N 個 Point
+# =========================
+class PointArray:
+    """N 個點，座標存成兩條連續的 float64 陣列（struct-of-arrays）"""
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs, ys):
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+
+    @staticmethod
+    def from_points(points: List[Point]) -> "PointArray":
+        return PointArray([p.x for p in points], [p.y for p in points])
+
+    def to_points(self) -> List[Point]:
+        return [Point(float(x), float(y)) for x, y in zip(self.xs, self.ys)]
+
+    # 與 (N,2) 排列互轉，方便跟其他 numpy 程式碼接軌
+    @staticmethod
+    def from_xy(xy) -> "PointArray":
+        xy = np.asarray(xy, dtype=np.float64)
+        return PointArray(xy[:, 0], xy[:, 1])
+
+    def to_xy(self) -> np.ndarray:
+        return np.column_stack((self.xs, self.ys))
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    # --- transforms（語意同 Point 的版本，但整批一次算）---
+    def translate(self, dx: float, dy: float) -> "PointArray":
+        return PointArray(self.xs + dx, self.ys + dy)
+
+    def scale(self, s: float, center: Point = None) -> "PointArray":
+        if center is None:
+            center = Point(0.0, 0.0)
+        return PointArray(center.x + (self.xs - center.x) * s,
+                          center.y + (self.ys - center.y) * s)
+
+    def rotate(self, theta_rad: float, center: Point = None) -> "PointArray":
+        if center is None:
+            center = Point(0.0, 0.0)
+        c = math.cos(theta_rad)
+        s = math.sin(theta_rad)
+        vx = self.xs - center.x
+        vy = self.ys - center.y
+        return PointArray(c * vx - s * vy + center.x,
+                          s * vx + c * vy + center.y)
+
+    def __repr__(self) -> str:
+        return f"PointArray(n={len(self)})"
+
+
+class TriangleArray:
+    """N 個三角形，頂點各是一個 PointArray"""
+    __slots__ = ("a", "b", "c")
+
+    def __init__(self, a: PointArray, b: PointArray, c: PointArray):
+        self.a = a
+        self.b = b
+        self.c = c
+
+    @staticmethod
+    def from_triangles(tris: List["Triangle"]) -> "TriangleArray":
+        return TriangleArray(
+            PointArray.from_points([t.a for t in tris]),
+            PointArray.from_points([t.b for t in tris]),
+            PointArray.from_points([t.c for t in tris]),
+        )
+
+    def to_triangles(self) -> List["Triangle"]:
+        return [Triangle(a, b, c) for a, b, c in
+                zip(self.a.to_points(), self.b.to_points(), self.c.to_points())]
+
+    def __len__(self) -> int:
+        return len(self.a)
+
+    def areas(self) -> np.ndarray:
+        # 0.5 * |(b-a) x (c-a)| ，整批一次
+        ux = self.b.xs - self.a.xs
+        uy = self.b.ys - self.a.ys
+        vx = self.c.xs - self.a.xs
+        vy = self.c.ys - self.a.ys
+        return 0.5 * np.abs(ux * vy - uy * vx)
+
+    def translate(self, dx: float, dy: float) -> "TriangleArray":
+        return TriangleArray(self.a.translate(dx, dy),
+                             self.b.translate(dx, dy),
+                             self.c.translate(dx, dy))
+
+    def scale(self, s: float, center: Point = None) -> "TriangleArray":
+        return TriangleArray(self.a.scale(s, center),
+                             self.b.scale(s, center),
+                             self.c.scale(s, center))
+
+    def rotate(self, theta_rad: float, center: Point = None) -> "TriangleArray":
+        return TriangleArray(self.a.rotate(theta_rad, center),
+                             self.b.rotate(theta_rad, center),
+                             self.c.rotate(theta_rad, center))
+
+
 # =========================
 # Line: represented as ax + by + c = 0
 # =========================
@@ -80,6 +289,20 @@ class Line:
     b: float
     c: float
 
+    def __post_init__(self):
+        # intersection 熱路徑每次要讀六個屬性；先打包成一個 tuple，
+        # 之後六次 LOAD_ATTR 變成兩次（frozen 所以走 object.__setattr__）
+        object.__setattr__(self, "_abc", (self.a, self.b, self.c))
+        # 法向量長度（及其倒數）也一次算好：norm2/norm 給讀值用，
+        # 倒數讓熱路徑用乘法取代除法。退化線（a=b=0）倒數存 0.0，
+        # 使用端以此判斷並報錯
+        n2 = self.a * self.a + self.b * self.b
+        inv_n2 = 1.0 / n2 if n2 > EPS else 0.0
+        object.__setattr__(self, "norm2", n2)
+        object.__setattr__(self, "norm", math.sqrt(n2))
+        object.__setattr__(self, "_inv_norm2", inv_n2)
+        object.__setattr__(self, "_inv_norm", math.sqrt(inv_n2))
+
     @staticmethod
     def from_points(p1: Point, p2: Point) -> "Line":
         # Through p1(x1,y1), p2(x2,y2)
@@ -109,22 +332,33 @@ class Line:
         # Solve:
         # a1 x + b1 y + c1 = 0
         # a2 x + b2 y + c2 = 0
-        det = self.a * other.b - other.a * self.b
+        a1, b1, c1 = self._abc
+        a2, b2, c2 = other._abc
+        det = a1 * b2 - a2 * b1
         if abs(det) <= EPS:
             return None  # parallel or coincident
-        x = (self.b * other.c - other.b * self.c) / det
-        y = (other.a * self.c - self.a * other.c) / det
+        inv = 1.0 / det  # 一次倒數換掉兩次除法
+        x = (b1 * c2 - b2 * c1) * inv
+        y = (a2 * c1 - a1 * c2) * inv
         return Point(x, y)
 
     def projection_of(self, p: Point) -> Point:
         # Foot of perpendicular from p to this line:
         # line: ax+by+c=0
         # proj = ( x - a*(ax+by+c)/(a^2+b^2), y - b*(ax+by+c)/(a^2+b^2) )
-        denom = self.a * self.a + self.b * self.b
-        if denom <= EPS:
+        inv_n2 = self._inv_norm2
+        if inv_n2 == 0.0:
+            raise ValueError("Invalid line: a=b=0")
+        fx, fy = _project_kernel(self.a, self.b, self.c, p.x, p.y, inv_n2)
+        return Point(fx, fy)
+
+    def projection_of_array(self, pts: "PointArray") -> "PointArray":
+        # 整批垂足：N 個點共用同一條線，幾個向量運算一次算完
+        inv_n2 = self._inv_norm2
+        if inv_n2 == 0.0:
             raise ValueError("Invalid line: a=b=0")
-        t = (self.a * p.x + self.b * p.y + self.c) / denom
-        return Point(p.x - self.a * t, p.y - self.b * t)
+        t = (self.a * pts.xs + self.b * pts.ys + self.c) * inv_n2
+        return PointArray(pts.xs - self.a * t, pts.ys - self.b * t)
 
     def perpendicular_through(self, p: Point) -> "Line":
         # A perpendicular line has normal vector parallel to this line's direction (b,-a)
@@ -250,71 +484,94 @@ def intersect_line_circle(line: Line, circle: Circle) -> List[Point]:
     # Solve line + circle:
     # line: ax+by+c=0
     # circle: (x-h)^2 + (y-k)^2 = r^2
-    # Use projection + distance method:
-    h, k = circle.center.x, circle.center.y
-    r = circle.r
-
-    # distance from center to line:
-    denom = math.sqrt(line.a * line.a + line.b * line.b)
-    if denom <= EPS:
+    # 投影 + 距離法，數學都在 jit kernel 裡
+    n, x1, y1, x2, y2 = _intersect_lc_kernel(
+        line.a, line.b, line.c, circle.center.x, circle.center.y, circle.r,
+        line._inv_norm)
+    if n < 0:
         raise ValueError("Invalid line for intersection.")
-    d = abs(line.a * h + line.b * k + line.c) / denom
-
-    if d > r + 1e-9:
+    if n == 0:
         return []  # no intersection
-    foot = line.projection_of(circle.center)
-
-    if is_close(d, r, 1e-7):
-        return [foot]  # tangent
-
-    # Two points: move along line direction unit vector by t = sqrt(r^2 - d^2)
-    dirv = line.direction()
-    L = dirv.norm()
-    if L <= EPS:
-        raise ValueError("Invalid line direction.")
-    u = Point(dirv.x / L, dirv.y / L)
-    t = math.sqrt(max(0.0, r * r - d * d))
-    p1 = foot + u * t
-    p2 = foot - u * t
-    return [p1, p2]
+    if n == 1:
+        return [Point(x1, y1)]  # tangent
+    return [Point(x1, y1), Point(x2, y2)]
 
 
 def intersect_circle_circle(c1: Circle, c2: Circle) -> List[Point]:
-    # Standard circle-circle intersection geometry
-    p0, r0 = c1.center, c1.r
-    p1, r1 = c2.center, c2.r
-    d = p0.dist(p1)
-
-    # No solutions: separate, one inside other, or coincident
-    if d > r0 + r1 + 1e-9:
+    # Standard circle-circle intersection geometry（計算在 jit kernel）
+    n, x1, y1, x2, y2 = _intersect_cc_kernel(
+        c1.center.x, c1.center.y, c1.r, c2.center.x, c2.center.y, c2.r)
+    if n == 0:
+        # separate / one inside other / coincident
         return []
-    if d < abs(r0 - r1) - 1e-9:
-        return []
-    if d <= EPS and abs(r0 - r1) <= 1e-9:
-        # Infinite intersections (same circle) -> return empty, ambiguous
-        return []
-
-    # a = distance from p0 to line of intersection points along p0->p1
-    a = (r0 * r0 - r1 * r1 + d * d) / (2 * d)
-    h2 = r0 * r0 - a * a
-    if h2 < 0 and h2 > -1e-8:
-        h2 = 0.0
-    if h2 < 0:
-        return []
-
-    # point p2 is base point
-    v = (p1 - p0) * (1.0 / d)  # unit vector from p0 to p1
-    p2 = p0 + v * a
-
-    if is_close(h2, 0.0, 1e-7):
-        return [p2]  # tangent
-
-    h = math.sqrt(h2)
-    # perpendicular unit vector
-    perp = Point(-v.y, v.x)
-    i1 = p2 + perp * h
-    i2 = p2 - perp * h
-    return [i1, i2]
+    if n == 1:
+        return [Point(x1, y1)]  # tangent
+    return [Point(x1, y1), Point(x2, y2)]
+
+
+def intersect_line_circle_batch(lines, circles) -> np.ndarray:
+    """一次解 N 組線與圓的交點（同 circle 批次版的約定）。
+
+    lines: (N,3) 的 (a, b, c)；circles: (N,3) 的 (cx, cy, r)。
+    回傳 (N,4) 的 [x1, y1, x2, y2]；無交點或無效線的列整列為 NaN，
+    相切時兩個點相同。
+    """
+    L = np.asarray(lines, dtype=np.float64)
+    C = np.asarray(circles, dtype=np.float64)
+    a, b, c = L[:, 0], L[:, 1], L[:, 2]
+    h, k, r = C[:, 0], C[:, 1], C[:, 2]
+
+    n2 = a * a + b * b
+    valid = n2 > 1e-18
+    n2s = np.where(valid, n2, 1.0)
+    denom = np.sqrt(n2s)
+    num = a * h + b * k + c
+    d = np.abs(num) / denom
+    valid &= d <= r + 1e-9
+
+    t = num / n2s
+    fx = h - a * t
+    fy = k - b * t
+    ux = b / denom
+    uy = -a / denom
+    step = np.sqrt(np.clip(r * r - d * d, 0.0, None))
+    out = np.stack([fx + ux * step, fy + uy * step,
+                    fx - ux * step, fy - uy * step], axis=1)
+    return np.where(valid[:, None], out, np.nan)
+
+
+def intersect_circle_circle_batch(circles0, circles1) -> np.ndarray:
+    """一次解 N 對圓的交點（branchless，模擬時逐樣本呼叫的熱路徑）。
+
+    circles0/circles1: (N,3) 的 (cx, cy, r)。
+    回傳 (N,4) 的 [x1, y1, x2, y2]；無交點（相離/內含/同心）的列
+    整列為 NaN，相切時兩個點相同。呼叫端用 ~np.isnan(out[:,0]) 過濾。
+    """
+    c0 = np.asarray(circles0, dtype=np.float64)
+    c1 = np.asarray(circles1, dtype=np.float64)
+    x0, y0, r0 = c0[:, 0], c0[:, 1], c0[:, 2]
+    x1, y1, r1 = c1[:, 0], c1[:, 1], c1[:, 2]
+
+    dx = x1 - x0
+    dy = y1 - y0
+    d = np.hypot(dx, dy)
+    valid = ((d <= r0 + r1 + 1e-9)
+             & (d >= np.abs(r0 - r1) - 1e-9)
+             & (d > 1e-9))
+
+    # 無效列一樣跟著算（除數換成 1 避免警告），最後整列蓋成 NaN：
+    # 沒有任何 Python 分支，整批都是向量運算
+    ds = np.where(valid, d, 1.0)
+    a = (r0 * r0 - r1 * r1 + ds * ds) / (2.0 * ds)
+    h2 = np.clip(r0 * r0 - a * a, 0.0, None)
+    hh = np.sqrt(h2)
+    vx = dx / ds
+    vy = dy / ds
+    px = x0 + vx * a
+    py = y0 + vy * a
+    out = np.stack([px - vy * hh, py + vx * hh,
+                    px + vy * hh, py - vx * hh], axis=1)
+    return np.where(valid[:, None], out, np.nan)
 
 
 # =========================
@@ -10,9 +10,10 @@
 """
 
 import math
-import random
 from typing import List, Tuple
 
+import numpy as np
+
 # =========================
 # 1) p^10000 與模擬
 # =========================
@@ -26,13 +27,20 @@ def simulate_all_heads(p: float, n: int, trials: int = 1000) -> float:
     蒙地卡羅估計：在 trials 次實驗中，丟 n 次都正面的比例。
     對 n=10000 幾乎永遠都是 0（因為真實機率 2^-10000 太小）。
     """
+    # 逐枚呼叫 random.random() 是 n*trials 次 Python 呼叫；
+    # 改成整塊丟給 numpy 一次生成。一塊一塊驗可以保留原本
+    # 「一出現反面就放棄這回合」的短路：p=0.5 時第一塊幾乎必敗
     cnt = 0
+    chunk = 256
     for _ in range(trials):
         ok = True
-        for _ in range(n):
-            if random.random() >= p:
+        done = 0
+        while done < n:
+            m = min(chunk, n - done)
+            if not (np.random.random(m) < p).all():
                 ok = False
                 break
+            done += m
         if ok:
             cnt += 1
     return cnt / trials
@@ -53,69 +61,66 @@ def log_prob_power(p: float, n: int) -> float:
 
 EPS = 1e-15
 
-def _normalize(dist: List[float]) -> List[float]:
-    s = sum(dist)
+# base=2 是熱路徑：1/log(2) 當模組常數，其他底才現算；
+# 乘上倒數也比在總和上做除法便宜
+_INV_LOG2 = 1.0 / math.log(2.0)
+
+def _inv_logb(base: float) -> float:
+    return _INV_LOG2 if base == 2.0 else 1.0 / math.log(base)
+
+def _normalize(dist: List[float]) -> np.ndarray:
+    p = np.asarray(dist, dtype=np.float64)
+    s = p.sum()
     if s <= 0:
         raise ValueError("Distribution sum must be positive.")
-    return [x / s for x in dist]
+    return p / s
+
+# 這組函數都改成一次 np.log 向量運算 + 一個 np.dot 收尾，
+# 取代逐元素 math.log 的 Python 迴圈；logb 只除一次
 
 def entropy(p: List[float], base: float = 2.0) -> float:
     """H(p) = - sum p_i log p_i"""
     p = _normalize(p)
-    logb = math.log(base)
-    h = 0.0
-    for pi in p:
-        if pi > 0:
-            h -= pi * (math.log(pi) / logb)
-    return h
+    p = p[p > 0]   # 0 log 0 = 0，直接拿掉
+    return -float(np.dot(p, np.log(p))) * _inv_logb(base)
 
 def cross_entropy(p: List[float], q: List[float], base: float = 2.0) -> float:
     """H(p,q) = - sum p_i log q_i"""
     p = _normalize(p)
     q = _normalize(q)
-    logb = math.log(base)
-    ce = 0.0
-    for pi, qi in zip(p, q):
-        # 若 q_i=0 且 p_i>0 交叉熵為 +inf；用極小值避免崩潰但仍顯示很大
-        qi_safe = max(qi, EPS)
-        if pi > 0:
-            ce -= pi * (math.log(qi_safe) / logb)
-    return ce
+    mask = p > 0
+    # 若 q_i=0 且 p_i>0 交叉熵為 +inf；夾到 EPS 避免崩潰但仍顯示很大
+    q_safe = np.clip(q[mask], EPS, None)
+    return -float(np.dot(p[mask], np.log(q_safe))) * _inv_logb(base)
 
 def kl_divergence(p: List[float], q: List[float], base: float = 2.0) -> float:
     """D_KL(p||q) = sum p_i log(p_i/q_i)"""
     p = _normalize(p)
     q = _normalize(q)
-    logb = math.log(base)
-    kl = 0.0
-    for pi, qi in zip(p, q):
-        if pi > 0:
-            qi_safe = max(qi, EPS)
-            kl += pi * (math.log(pi / qi_safe) / logb)
-    return kl
+    mask = p > 0
+    pm = p[mask]
+    # log(p/q) = log p - log q：省掉整條除法向量，
+    # 兩條 log 也只各呼叫一次
+    logq = np.log(np.clip(q[mask], EPS, None))
+    return float(np.dot(pm, np.log(pm) - logq)) * _inv_logb(base)
 
 def mutual_information(joint: List[List[float]], base: float = 2.0) -> float:
     """
     I(X;Y) = sum_{x,y} p(x,y) log( p(x,y) / (p(x)p(y)) )
     joint: 二維聯合分佈矩陣
     """
-    # normalize joint
-    total = sum(sum(row) for row in joint)
+    J = np.asarray(joint, dtype=np.float64)
+    total = J.sum()
     if total <= 0:
         raise ValueError("Joint distribution must sum to positive.")
-    Pxy = [[v / total for v in row] for row in joint]
-    px = [sum(row) for row in Pxy]
-    py = [sum(Pxy[i][j] for i in range(len(Pxy))) for j in range(len(Pxy[0]))]
-
-    logb = math.log(base)
-    I = 0.0
-    for i in range(len(Pxy)):
-        for j in range(len(Pxy[0])):
-            pxy = Pxy[i][j]
-            if pxy > 0:
-                denom = max(px[i] * py[j], EPS)
-                I += pxy * (math.log(pxy / denom) / logb)
-    return I
+    Pxy = J / total
+    # 邊際分佈：keepdims 讓 px*py 直接 broadcast 成外積
+    px = Pxy.sum(axis=1, keepdims=True)
+    py = Pxy.sum(axis=0, keepdims=True)
+    denom = np.maximum(px * py, EPS)
+    # np.where 保住 0 log 0 = 0，也避免對 0 取 log 的警告
+    terms = np.where(Pxy > 0, Pxy * np.log(np.where(Pxy > 0, Pxy, 1.0) / denom), 0.0)
+    return float(terms.sum()) * _inv_logb(base)
 
 def verify_cross_entropy_inequality(p: List[float], q: List[float]) -> None:
     """
@@ -202,6 +207,92 @@ def hamming74_decode(code7: List[int]) -> Tuple[List[int], int, List[int]]:
     d4 = corrected[6]
     return [d1, d2, d3, d4], error_pos, corrected
 
+# --- 位元打包版本：整個碼字塞進一個 int 的低 7 位 ---
+# bit k（0-based）對應 1-based 位置 k+1；三個遮罩就是三組校驗涵蓋的位置。
+# 校驗位 = popcount(code & mask) & 1，CPython 3.10+ 的 int.bit_count()
+# 會對應到硬體 POPCNT：三個 AND + 三個 POPCNT 取代七次 list 索引 XOR
+
+_H74_MASK1 = 0b1010101   # 位置 1,3,5,7
+_H74_MASK2 = 0b1100110   # 位置 2,3,6,7
+_H74_MASK4 = 0b1111000   # 位置 4,5,6,7
+
+def hamming74_encode_packed(data4: int) -> int:
+    """data4: 4 位元整數（bit0=d1 .. bit3=d4）-> 7 位元碼字"""
+    d1 = data4 & 1
+    d2 = (data4 >> 1) & 1
+    d3 = (data4 >> 2) & 1
+    d4 = (data4 >> 3) & 1
+    code = (d1 << 2) | (d2 << 4) | (d3 << 5) | (d4 << 6)
+    p1 = (code & _H74_MASK1).bit_count() & 1
+    p2 = (code & _H74_MASK2).bit_count() & 1
+    p4 = (code & _H74_MASK4).bit_count() & 1
+    return code | p1 | (p2 << 1) | (p4 << 3)
+
+def hamming74_decode_packed(code7: int) -> Tuple[int, int, int]:
+    """回傳 (data4, error_pos, corrected_code7)，皆為打包後的 int"""
+    code = code7 & 0x7F
+    s1 = (code & _H74_MASK1).bit_count() & 1
+    s2 = (code & _H74_MASK2).bit_count() & 1
+    s4 = (code & _H74_MASK4).bit_count() & 1
+    error_pos = s1 | (s2 << 1) | (s4 << 2)
+    if error_pos:
+        code ^= 1 << (error_pos - 1)
+    data4 = (((code >> 2) & 1)
+             | (((code >> 4) & 1) << 1)
+             | (((code >> 5) & 1) << 2)
+             | (((code >> 6) & 1) << 3))
+    return data4, error_pos, code
+
+# 打包碼字只有 128 種，解碼結果可以在 import 時全部查表建好；
+# 之後解一批 N 個碼字 = 三次 numpy fancy-index gather，
+# 每個碼字一次表查詢，連 popcount 都省了
+_H74_TABLE_DATA = np.empty(128, dtype=np.uint8)
+_H74_TABLE_POS = np.empty(128, dtype=np.uint8)
+_H74_TABLE_CORR = np.empty(128, dtype=np.uint8)
+for _c in range(128):
+    _d, _p, _corr = hamming74_decode_packed(_c)
+    _H74_TABLE_DATA[_c] = _d
+    _H74_TABLE_POS[_c] = _p
+    _H74_TABLE_CORR[_c] = _corr
+del _c, _d, _p, _corr
+
+def hamming74_decode_packed_batch(codes):
+    """codes: (N,) 的打包 uint8 碼字
+    回傳 (data4 (N,), error_pos (N,), corrected (N,))"""
+    c = np.asarray(codes, dtype=np.uint8) & 0x7F
+    return _H74_TABLE_DATA[c], _H74_TABLE_POS[c], _H74_TABLE_CORR[c]
+
+# --- 批次版本：一次處理 N 個碼字 ---
+# 逐字呼叫上面的 list 版本時，Python 開銷遠大於 XOR 本身；
+# 把位元放進 uint8 欄位後，整欄 XOR 是一條編譯過的向量運算
+
+def hamming74_encode_batch(data4) -> np.ndarray:
+    """data4: (N,4) 的 0/1 陣列 -> code7: (N,7)"""
+    d = np.asarray(data4, dtype=np.uint8) & 1
+    if d.ndim != 2 or d.shape[1] != 4:
+        raise ValueError("data4 must have shape (N, 4).")
+    d1, d2, d3, d4 = d[:, 0], d[:, 1], d[:, 2], d[:, 3]
+    p1 = d1 ^ d2 ^ d4
+    p2 = d1 ^ d3 ^ d4
+    p4 = d2 ^ d3 ^ d4
+    return np.stack([p1, p2, d1, p4, d2, d3, d4], axis=1)
+
+def hamming74_decode_batch(code7):
+    """code7: (N,7) -> (data4 (N,4), error_pos (N,), corrected (N,7))"""
+    c = np.asarray(code7, dtype=np.uint8) & 1
+    if c.ndim != 2 or c.shape[1] != 7:
+        raise ValueError("code7 must have shape (N, 7).")
+    s1 = c[:, 0] ^ c[:, 2] ^ c[:, 4] ^ c[:, 6]
+    s2 = c[:, 1] ^ c[:, 2] ^ c[:, 5] ^ c[:, 6]
+    s4 = c[:, 3] ^ c[:, 4] ^ c[:, 5] ^ c[:, 6]
+    error_pos = s1.astype(np.int64) + 2 * s2 + 4 * s4
+    corrected = c.copy()
+    rows = np.nonzero(error_pos)[0]
+    # fancy index 一次翻掉所有出錯位元
+    corrected[rows, error_pos[rows] - 1] ^= 1
+    data4 = corrected[:, [2, 4, 5, 6]]
+    return data4, error_pos, corrected
+
 # =========================
 # Demo / 主程式
 # =========================
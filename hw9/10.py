@@ -13,6 +13,19 @@
 import math
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:   # numba 未安裝時退回純 Python 版本
+    njit = None
+
+try:
+    import scipy.linalg as _sla
+except ImportError:   # 沒有 scipy 就用 numpy 的 LAPACK 包裝
+    _sla = None
+
+def _maybe_njit(fn):
+    return njit(cache=True, fastmath=True)(fn) if njit is not None else fn
+
 EPS = 1e-10
 
 # ============================================================
@@ -44,13 +57,17 @@ def det_recursive(A):
         return A[0, 0]
     if n == 2:
         return A[0, 0]*A[1, 1] - A[0, 1]*A[1, 0]
+    if n > 4:
+        # O(n!) 只留作小矩陣示範；大一點就交給 O(n^3) 的 LU
+        return det_via_lu(A)
 
     # 沿第一列展開
     total = 0.0
+    cols = np.arange(n)
     for j in range(n):
         if abs(A[0, j]) < EPS:
             continue
-        M = np.delete(np.delete(A, 0, axis=0), j, axis=1)  # minor
+        M = A[1:, cols != j]  # minor（一次 fancy index，不用連刪兩次）
         cofactor = ((-1) ** (0 + j)) * A[0, j] * det_recursive(M)
         total += cofactor
     return total
@@ -89,13 +106,13 @@ def lu_decompose_partial_pivot(A):
                 L[[k, pivot], :k] = L[[pivot, k], :k]
             swap_count += 1
 
-        # 消去
-        for i in range(k+1, n):
-            if abs(U[k, k]) < EPS:
-                continue
-            factor = U[i, k] / U[k, k]
-            L[i, k] = factor
-            U[i, k:] -= factor * U[k, k:]
+        # 消去：一次 rank-1 外積更新整個剩餘子塊，取代逐列 Python 迴圈
+        piv = U[k, k]
+        if abs(piv) < EPS:
+            continue
+        factors = U[k+1:, k] / piv
+        L[k+1:, k] = factors
+        U[k+1:, k:] -= factors[:, None] * U[k, k:][None, :]
 
     return P, L, U, swap_count
 
@@ -112,55 +129,67 @@ def det_via_lu(A):
 #    （為了 PCA / A^T A 的特徵分解做 SVD）
 # ============================================================
 
-def jacobi_eigen_symmetric(A, max_iter=10000, tol=1e-12):
-    A = np.array(A, dtype=float)
-    n = A.shape[0]
-    assert n == A.shape[1], "square only"
-    # 必須近似對稱
-    if np.linalg.norm(A - A.T, ord='fro') > 1e-8:
-        raise ValueError("Jacobi needs symmetric matrix")
-
-    Q = eye(n)
-    S = A.copy()
-
-    def offdiag_norm(M):
-        return math.sqrt(np.sum((M - np.diag(np.diag(M)))**2))
-
+@_maybe_njit
+def _jacobi_sweeps(S, Q, max_iter, tol):
+    # 熱迴圈獨立成純 float 函數讓 numba 編譯；
+    # S、Q 都原地更新，不再每輪配置 G 與兩個 n×n 暫存矩陣
+    n = S.shape[0]
     for _ in range(max_iter):
-        if offdiag_norm(S) < tol:
-            break
-
-        # 找最大非對角元素
+        # 找最大非對角元素，順便累積非對角平方和（上三角 ×2 = 全部）
         i, j = 0, 1
         maxv = 0.0
+        off2 = 0.0
         for r in range(n):
-            for c in range(r+1, n):
-                v = abs(S[r, c])
+            for c2 in range(r + 1, n):
+                v = abs(S[r, c2])
+                off2 += v * v
                 if v > maxv:
                     maxv = v
-                    i, j = r, c
+                    i, j = r, c2
 
-        if maxv < tol:
+        # 平方比較（2*off2 < tol^2 等價於 ||off||_F < tol），連 sqrt 都省
+        if 2.0 * off2 < tol * tol or maxv < tol:
             break
 
         # Jacobi 旋轉：消掉 S[i,j]
         if abs(S[i, i] - S[j, j]) < EPS:
             theta = math.pi / 4
         else:
-            theta = 0.5 * math.atan2(2*S[i, j], (S[j, j] - S[i, i]))
+            theta = 0.5 * math.atan2(2.0 * S[i, j], (S[j, j] - S[i, i]))
 
         c = math.cos(theta)
         s = math.sin(theta)
 
-        # 更新 S = G^T S G, Q = Q G
-        G = eye(n)
-        G[i, i] = c
-        G[j, j] = c
-        G[i, j] = s
-        G[j, i] = -s
+        # S = G^T S G 等價於只動第 i、j 列與欄的 rank-2 更新：
+        # 每輪 O(n) 而不是兩次 O(n^3) 矩陣乘法
+        for k in range(n):
+            Sik = S[i, k]
+            Sjk = S[j, k]
+            S[i, k] = c * Sik - s * Sjk
+            S[j, k] = s * Sik + c * Sjk
+        for k in range(n):
+            Ski = S[k, i]
+            Skj = S[k, j]
+            S[k, i] = c * Ski - s * Skj
+            S[k, j] = s * Ski + c * Skj
+        # Q = Q G 同樣只動兩欄
+        for k in range(n):
+            Qki = Q[k, i]
+            Qkj = Q[k, j]
+            Q[k, i] = c * Qki - s * Qkj
+            Q[k, j] = s * Qki + c * Qkj
+
+def jacobi_eigen_symmetric(A, max_iter=10000, tol=1e-12):
+    A = np.array(A, dtype=float)
+    n = A.shape[0]
+    assert n == A.shape[1], "square only"
+    # 必須近似對稱
+    if np.linalg.norm(A - A.T, ord='fro') > 1e-8:
+        raise ValueError("Jacobi needs symmetric matrix")
 
-        S = G.T @ S @ G
-        Q = Q @ G
+    Q = eye(n)
+    S = A.copy()
+    _jacobi_sweeps(S, Q, max_iter, tol)
 
     eigenvalues = np.diag(S).copy()
     eigenvectors = Q.copy()
@@ -175,44 +204,61 @@ def sort_eigs_desc(vals, vecs):
 #    Σ = sqrt(特徵值)，U = A V Σ^{-1}
 # ============================================================
 
-def svd_from_eig(A, tol=1e-10):
+def svd_from_eig(A, tol=1e-10, backend="lapack"):
     A = np.array(A, dtype=float)
     m, n = A.shape
 
     AtA = A.T @ A  # n x n 對稱
-    vals, V = jacobi_eigen_symmetric(AtA, max_iter=20000, tol=1e-14)
+    if backend == "lapack":
+        # 正式路徑交給 LAPACK 的對稱特徵值 solver（dsyevr 系列，
+        # 比 Python Jacobi 快幾個數量級）；backend='jacobi' 保留
+        # 「分解自己寫」的教學示範
+        if _sla is not None:
+            vals, V = _sla.eigh(AtA)
+        else:
+            vals, V = np.linalg.eigh(AtA)
+    elif backend == "jacobi":
+        vals, V = jacobi_eigen_symmetric(AtA, max_iter=20000, tol=1e-14)
+    else:
+        raise ValueError("backend must be 'lapack' or 'jacobi'")
     vals, V = sort_eigs_desc(vals, V)
 
+    # LAPACK 的零特徵值帶 ~1e-16 的「絕對」雜訊，開根號後約 1e-8，
+    # 會騙過絕對門檻 tol；先用相對門檻（n·eps·最大特徵值）把這些
+    # 雜訊歸零，rank-deficient 時才不會把垃圾欄寫進 U
+    vals = np.clip(vals, 0.0, None)
+    if vals.size and vals[0] > 0.0:
+        vals[vals < n * np.finfo(float).eps * vals[0]] = 0.0
+
     # 奇異值
-    sig = np.sqrt(np.clip(vals, 0.0, None))
+    sig = np.sqrt(vals)
 
     # 建 Σ（m x n 常見；這裡回傳 full 版本：U(mxm), Σ(mxn), V(nxn)
     U = eye(m)
     Sigma = np.zeros((m, n), dtype=float)
 
-    # 計算前 r 個非零奇異值的 U
+    # 計算前 r 個非零奇異值的 U：uk 直接寫進預先配置好的 U，
+    # 不經過 list + column_stack 的二次拷貝（sig 已遞減排序，
+    # 低於 tol 之後不會再有有效欄，ncols 與 k 對齊）
     r = min(m, n)
-    Ucols = []
+    ncols = 0
     for k in range(r):
         if sig[k] > tol:
             uk = A @ V[:, k] / sig[k]
-            uk = normalize(uk)
-            Ucols.append(uk)
+            U[:, ncols] = normalize(uk)
+            ncols += 1
             Sigma[k, k] = sig[k]
         else:
             Sigma[k, k] = 0.0
 
-    # 把已算出的 uk 填入 U 的前幾欄
-    if len(Ucols) > 0:
-        U[:, :len(Ucols)] = np.column_stack(Ucols)
-
-    # 若需要補齊 U 的其餘正交基底（這裡用簡單 Gram-Schmidt）
-    # 讓 U 近似正交
-    for k in range(len(Ucols), m):
-        v = np.random.randn(m)
-        for j in range(k):
-            v -= (U[:, j] @ v) * U[:, j]
-        U[:, k] = normalize(v)
+    # 補齊其餘正交基底：對 [U[:, :ncols] | I_m] 做 QR（LAPACK），
+    # 取代原本「隨機向量 + Python Gram-Schmidt」——更快，
+    # 也不會因抽到近平行向量而失去正交性；結果還是決定性的。
+    # 只取 Q 的後面幾欄，前 ncols 欄保持原本算出的 uk（QR 可能翻號）
+    if ncols < m:
+        M = np.column_stack((U[:, :ncols], eye(m))) if ncols > 0 else eye(m)
+        Qm, _ = np.linalg.qr(M)
+        U[:, ncols:] = Qm[:, ncols:m]
 
     return U, Sigma, V
 
@@ -255,12 +301,17 @@ def pca_via_svd(X, k=2):
     mu = X.mean(axis=0, keepdims=True)
     Xc = X - mu
 
-    U, S, V = svd_from_eig(Xc)  # 用我們自己的 SVD
-    # S 是 m x n 形狀，但對角線才有值
-    sing = np.diag(S)[:min(n, d)]
+    # PCA 只要 V 跟奇異值平方，而 Xc^T Xc 的特徵值正好是 Σ^2：
+    # 對 d×d 共變異矩陣做特徵分解（O(d^3)，n >> d 時遠小於整套
+    # SVD），完全不用算 m×m 的 U 和它的正交補
+    C = Xc.T @ Xc
+    vals, V = np.linalg.eigh(C)
+    idx = np.argsort(vals)[::-1]
+    vals = np.clip(vals[idx], 0.0, None)  # 數值誤差可能出現 -1e-16
+    V = V[:, idx]
 
     # explained variance
-    var = sing**2
+    var = vals
     total = var.sum() if var.sum() > EPS else 1.0
     ratio = var / total
 